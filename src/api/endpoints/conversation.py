@@ -80,7 +80,7 @@ async def store_conversation(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Conversation storage failed: {str(e)}")
+        logger.error("Conversation storage failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Storage failed: {str(e)}"
@@ -112,7 +112,7 @@ async def get_conversation(
         )
         
     except Exception as e:
-        logger.error(f"Conversation retrieval failed: {str(e)}")
+        logger.error("Conversation retrieval failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Retrieval failed: {str(e)}"
@@ -4,7 +4,6 @@ import time
 from typing import Dict, Any
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
 
 from src.core.config import settings
 from src.core.logging import get_logger
@@ -43,7 +42,7 @@ async def detailed_health_check() -> HealthCheckResponse:
         )
         
     except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
+        logger.error("Health check failed: %s", e)
         raise HTTPException(status_code=503, detail="Health check failed")
 
 
@@ -65,7 +64,7 @@ async def readiness_check() -> Dict[str, Any]:
             raise HTTPException(status_code=503, detail="Service not ready")
             
     except Exception as e:
-        logger.error(f"Readiness check failed: {str(e)}")
+        logger.error("Readiness check failed: %s", e)
         raise HTTPException(status_code=503, detail="Service not ready")
 
 
@@ -85,7 +84,7 @@ async def liveness_check() -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error(f"Liveness check failed: {str(e)}")
+        logger.error("Liveness check failed: %s", e)
         raise HTTPException(status_code=503, detail="Service not alive")
 
 
@@ -138,7 +137,7 @@ async def check_azure_openai() -> str:
             return "misconfigured"
             
     except Exception as e:
-        logger.warning(f"Azure OpenAI health check failed: {str(e)}")
+        logger.warning("Azure OpenAI health check failed: %s", e)
         return "unhealthy"
 
 
@@ -155,7 +154,7 @@ async def check_neo4j() -> str:
             return "misconfigured"
             
     except Exception as e:
-        logger.warning(f"Neo4j health check failed: {str(e)}")
+        logger.warning("Neo4j health check failed: %s", e)
         return "unhealthy"
 
 
@@ -172,7 +171,7 @@ async def check_vector_db() -> str:
             return "misconfigured"
             
     except Exception as e:
-        logger.warning(f"Vector DB health check failed: {str(e)}")
+        logger.warning("Vector DB health check failed: %s", e)
         return "unhealthy"
 
 
@@ -189,5 +188,5 @@ async def check_redis() -> str:
             return "misconfigured"
             
     except Exception as e:
-        logger.warning(f"Redis health check failed: {str(e)}")
+        logger.warning("Redis health check failed: %s", e)
  
\ No newline at end of file
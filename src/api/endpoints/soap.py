@@ -16,7 +16,7 @@ from src.models.soap_models import (
     ProcessingMetadata,
     SOAPSectionType
 )
-from src.models.api_models import ErrorResponse, SuccessResponse
+from src.models.api_models import ErrorResponse
 from src.services.soap_generator import SOAPGeneratorService
 from src.services.conversation_rag import ConversationRAGService
 from src.services.snomed_rag import SNOMEDRAGService
@@ -171,7 +171,7 @@ async def generate_soap_section(
             )
         
         logger.info(
-            f"SOAP section generated successfully",
+            "SOAP section generated successfully",
             extra={
                 "section_id": response.section_id,
                 "processing_time_ms": processing_time_ms,
@@ -190,7 +190,7 @@ async def generate_soap_section(
         processing_time_ms = (time.time() - start_time) * 1000
         
         logger.error(
-            f"SOAP generation failed: {str(e)}",
+            "SOAP generation failed: %s", e,
             extra={"processing_time_ms": processing_time_ms}
         )
         
@@ -265,7 +265,7 @@ async def validate_soap_section(
         return validation_result
         
     except Exception as e:
-        logger.error(f"SOAP validation failed: {str(e)}")
+        logger.error("SOAP validation failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Validation failed: {str(e)}"
@@ -300,7 +300,7 @@ async def get_soap_section(
         }
         
     except Exception as e:
-        logger.error(f"SOAP section retrieval failed: {str(e)}")
+        logger.error("SOAP section retrieval failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Retrieval failed: {str(e)}"
@@ -318,13 +318,13 @@ async def learn_doctor_patterns(
     """Background task to learn doctor patterns."""
     try:
         # This would implement pattern learning logic
-        logger.info(f"Learning patterns for doctor {doctor_id}")
+        logger.info("Learning patterns for doctor %s", doctor_id)
         
         # Placeholder for pattern learning implementation
         pass
         
     except Exception as e:
-        logger.error(f"Pattern learning failed: {str(e)}")
+        logger.error("Pattern learning failed: %s", e)
 
 
 # Error handlers specific to SOAP endpoints
@@ -5,12 +5,13 @@ handling all environment variables and application settings for the medical
 SOAP generation microservice.
 """
 
-import os
-from functools import lru_cache
 from typing import List, Optional
 
-from pydantic import Field, validator
-from pydantic_settings import BaseSettings
+from pydantic import Field, model_validator, validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# Environment file the settings are loaded from
+ENV_FILE = ".env"
 
 
 class Settings(BaseSettings):
@@ -43,6 +44,9 @@ class Settings(BaseSettings):
         default="2024-05-01-preview", description="Azure OpenAI API version"
     )
     azure_openai_model: str = Field(default="gpt-4", description="Azure OpenAI model")
+    azure_openai_rpm_limit: Optional[int] = Field(
+        default=None, ge=1, description="Azure OpenAI deployment requests-per-minute quota"
+    )
     
     # Azure OpenAI Embeddings
     openai_embedding_endpoint: str = Field(description="OpenAI embedding endpoint")
@@ -245,9 +249,21 @@ class Settings(BaseSettings):
     soap_context_window_size: int = Field(
         default=8000, description="SOAP context window size"
     )
+    section_concurrency: int = Field(
+        default=6, ge=1, description="Max concurrent section generations in a batch"
+    )
     soap_max_retries: int = Field(default=3, description="SOAP max retries")
     soap_retry_delay: int = Field(default=2, description="SOAP retry delay")
-    
+
+    # Response Cache
+    response_cache_enabled: bool = Field(
+        default=False, description="Exact-match response cache enabled"
+    )
+    response_cache_max_entries: int = Field(
+        default=1000, description="Response cache max entries"
+    )
+    response_cache_ttl: int = Field(default=3600, description="Response cache TTL")
+
     # Quality Assurance
     soap_validation_enabled: bool = Field(default=True, description="SOAP validation enabled")
     soap_snomed_validation: bool = Field(
@@ -297,6 +313,9 @@ class Settings(BaseSettings):
     # Privacy Settings
     anonymize_logs: bool = Field(default=True, description="Anonymize logs")
     mask_pii: bool = Field(default=True, description="Mask PII")
+    pii_mask_min_level: str = Field(
+        default="DEBUG", description="Lowest log level that is PII-masked"
+    )
     gdpr_compliance: bool = Field(default=True, description="GDPR compliance")
     
     # =============================================================================
@@ -310,36 +329,32 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(",")]
         return v
     
-    @validator("vector_db_type")
-    def validate_vector_db_type(cls, v):
-        """Validate vector database type."""
+    @model_validator(mode="after")
+    def validate_settings(self) -> "Settings":
+        """Validate enumerated and constrained settings in a single pass."""
         allowed_types = ["chroma", "weaviate"]
-        if v not in allowed_types:
+        if self.vector_db_type not in allowed_types:
             raise ValueError(f"vector_db_type must be one of {allowed_types}")
-        return v
-    
-    @validator("snomed_rag_language")
-    def validate_snomed_language(cls, v):
-        """Validate SNOMED RAG language."""
+        
         allowed_languages = ["en", "fr", "both"]
-        if v not in allowed_languages:
+        if self.snomed_rag_language not in allowed_languages:
             raise ValueError(f"snomed_rag_language must be one of {allowed_languages}")
-        return v
-    
-    @validator("log_level")
-    def validate_log_level(cls, v):
-        """Validate log level."""
+        
         allowed_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in allowed_levels:
+        log_level = self.log_level.upper()
+        if log_level not in allowed_levels:
             raise ValueError(f"log_level must be one of {allowed_levels}")
-        return v.upper()
-    
-    @validator("encryption_key")
-    def validate_encryption_key(cls, v):
-        """Validate encryption key length."""
-        if len(v) < 32:
+        pii_mask_min_level = self.pii_mask_min_level.upper()
+        if pii_mask_min_level not in allowed_levels:
+            raise ValueError(f"pii_mask_min_level must be one of {allowed_levels}")
+        # The model is frozen, so normalize through __dict__
+        self.__dict__["log_level"] = log_level
+        self.__dict__["pii_mask_min_level"] = pii_mask_min_level
+        
+        if len(self.encryption_key) < 32:
             raise ValueError("encryption_key must be at least 32 characters long")
-        return v
+        
+        return self
     
     # =============================================================================
     # Properties
@@ -362,19 +377,32 @@ class Settings(BaseSettings):
         """Check if running in production environment."""
         return self.environment.lower() == "production"
     
-    class Config:
-        """Pydantic configuration."""
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-        extra = "ignore"
+    model_config = SettingsConfigDict(
+        env_file=ENV_FILE,
+        env_file_encoding="utf-8",
+        env_ignore_empty=True,
+        case_sensitive=False,
+        extra="ignore",
+        frozen=True,
+    )
 
 
-@lru_cache()
 def get_settings() -> Settings:
-    """Get cached application settings."""
-    return Settings()
+    """Get the application settings singleton."""
+    return settings
+
+
+def reload_settings() -> Settings:
+    """Rebuild the settings singleton from the environment.
+    
+    Intended for tests and tooling after the environment or .env file
+    changes. Modules that imported ``settings`` directly keep the previous
+    instance; use ``get_settings()`` where a reload must be observed.
+    """
+    global settings
+    settings = Settings()
+    return settings
 
 
 # Global settings instance
-settings = get_settings() 
\ No newline at end of file
+settings = Settings()
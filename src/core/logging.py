@@ -4,17 +4,67 @@ This module provides structured logging with security features, PII masking,
 and proper formatting for the medical SOAP generation microservice.
 """
 
+import atexit
+import contextvars
+import copy
 import json
 import logging
 import logging.handlers
+import queue
 import re
 import sys
-from datetime import datetime
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from src.core.config import settings
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+# Standard LogRecord attributes; anything else on a record came from ``extra``
+_RESERVED_LOGRECORD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 'filename',
+    'module', 'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
+    'thread', 'threadName', 'processName', 'process', 'taskName', 'message',
+    'asctime', 'exc_info', 'exc_text', 'stack_info',
+})
+
+
+# (epoch second, formatted prefix) of the most recently formatted timestamp
+_cached_timestamp_prefix = (-1, "")
+
+
+def _utc_isoformat(timestamp: float) -> str:
+    """Format an epoch timestamp as ISO-8601 UTC, reusing the per-second prefix."""
+    global _cached_timestamp_prefix
+    second = int(timestamp)
+    cached_second, prefix = _cached_timestamp_prefix
+    if second != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+        _cached_timestamp_prefix = (second, prefix)
+    return f"{prefix}.{int((timestamp - second) * 1_000_000):06d}Z"
+
+
+def _json_dumps(data: Dict[str, Any]) -> str:
+    """Serialize a log payload to JSON, preferring orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except (TypeError, orjson.JSONEncodeError):
+            # e.g. integers beyond 64 bits, which never reach ``default``
+            pass
+    return json.dumps(data, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+def _unmasked(value: Any) -> Any:
+    """Return a log field unchanged when PII masking is disabled."""
+    return value
+
 
 class PIIMaskingFormatter(logging.Formatter):
     """Custom formatter that masks PII in log messages."""
@@ -26,14 +76,28 @@ class PIIMaskingFormatter(logging.Formatter):
         'ssn': re.compile(r'\b\d{3}-?\d{2}-?\d{4}\b'),
         'credit_card': re.compile(r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b'),
         'ip_address': re.compile(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b'),
-        'patient_id': re.compile(r'\b[Pp]atient[-_\s]*[Ii][Dd]?:?\s*([A-Z0-9-]+)\b'),
+        'patient_id': re.compile(r'\b[Pp]atient[-_\s]*[Ii][Dd]?\b:?\s*([A-Z0-9-]+)\b'),
         'mrn': re.compile(r'\b[Mm][Rr][Nn]:?\s*([A-Z0-9-]+)\b'),
     }
     
+    # Value patterns in one alternation so each message is scanned once
+    PII_REGEX = re.compile('|'.join(
+        f'(?P<{pii_type}>{pattern.pattern})' for pii_type, pattern in PII_PATTERNS.items()
+        if pii_type not in ('patient_id', 'mrn')
+    ))
+    
+    # Labelled identifiers run afterwards, as in the original sequential passes,
+    # so numbers following a label are already masked by the value patterns
+    PII_LABEL_REGEX = re.compile(
+        f"{PII_PATTERNS['patient_id'].pattern}|{PII_PATTERNS['mrn'].pattern}"
+    )
+    
     def __init__(self, mask_pii: bool = True, *args, **kwargs):
         """Initialize PII masking formatter."""
         super().__init__(*args, **kwargs)
         self.mask_pii = mask_pii
+        self.mask_min_level = getattr(logging, settings.pii_mask_min_level)
+        self._cached_time = (-1, None, "")
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with PII masking."""
@@ -41,24 +105,66 @@ class PIIMaskingFormatter(logging.Formatter):
         formatted = super().format(record)
         
         # Apply PII masking if enabled
-        if self.mask_pii and settings.mask_pii:
+        if self._should_mask(record):
             formatted = self._mask_pii(formatted)
         
         return formatted
     
+    def _should_mask(self, record: logging.LogRecord) -> bool:
+        """Check whether PII masking applies to this record."""
+        return self.mask_pii and settings.mask_pii and record.levelno >= self.mask_min_level
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the record time, reusing the result within the same second."""
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, cached_datefmt, formatted = self._cached_time
+        if second != cached_second or datefmt != cached_datefmt:
+            formatted = time.strftime(datefmt, self.converter(second))
+            self._cached_time = (second, datefmt, formatted)
+        return formatted
+    
     def _mask_pii(self, text: str) -> str:
         """Mask PII in text using defined patterns."""
-        for pii_type, pattern in self.PII_PATTERNS.items():
-            if pii_type == 'email':
-                text = pattern.sub(lambda m: f"***@{m.group().split('@')[1]}", text)
-            elif pii_type in ['phone', 'ssn', 'credit_card']:
-                text = pattern.sub("***-**-****", text)
-            elif pii_type == 'ip_address':
-                text = pattern.sub("***.***.***.***", text)
-            elif pii_type in ['patient_id', 'mrn']:
-                text = pattern.sub(lambda m: f"{m.group().split(':')[0]}:***", text)
-        
-        return text
+        text = self.PII_REGEX.sub(self._mask_match, text)
+        return self.PII_LABEL_REGEX.sub(self._mask_label, text)
+    
+    def _mask_value(self, value: Any) -> Any:
+        """Mask PII in a log field, descending into containers."""
+        if value is None or isinstance(value, (bool, int, float)):
+            return value
+        if isinstance(value, str):
+            # Covers str-based enums without switching them to their repr
+            return self._mask_pii(value)
+        if isinstance(value, dict):
+            return {
+                self._mask_value(key): self._mask_value(item)
+                for key, item in value.items()
+            }
+        if isinstance(value, (list, tuple)):
+            return [self._mask_value(item) for item in value]
+        return self._mask_pii(str(value))
+    
+    @staticmethod
+    def _mask_match(match: re.Match) -> str:
+        """Return the masked replacement for a single PII match."""
+        pii_type = match.lastgroup
+        if pii_type == 'email':
+            return f"***@{match.group().split('@')[1]}"
+        if pii_type in ('phone', 'ssn', 'credit_card'):
+            return "***-**-****"
+        return "***.***.***.***"
+    
+    @staticmethod
+    def _mask_label(match: re.Match) -> str:
+        """Keep the patient ID / MRN label and mask only the identifier after it."""
+        group = 1 if match.group(1) is not None else 2
+        start = match.start()
+        return (
+            f"{match.string[start:match.start(group)]}***"
+            f"{match.string[match.end(group):match.end()]}"
+        )
 
 
 class JSONFormatter(PIIMaskingFormatter):
@@ -66,11 +172,15 @@ class JSONFormatter(PIIMaskingFormatter):
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
+        # Mask caller-supplied content only; record metadata (logger, module,
+        # function and thread names) comes from code and never carries PII
+        mask = self._mask_value if self._should_mask(record) else _unmasked
+        
         log_data = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': _utc_isoformat(record.created),
             'level': record.levelname,
             'logger': record.name,
-            'message': record.getMessage(),
+            'message': mask(record.getMessage()),
             'module': record.module,
             'function': record.funcName,
             'line': record.lineno,
@@ -80,24 +190,14 @@ class JSONFormatter(PIIMaskingFormatter):
         
         # Add exception info if present
         if record.exc_info:
-            log_data['exception'] = self.formatException(record.exc_info)
+            log_data['exception'] = mask(self.formatException(record.exc_info))
         
         # Add extra fields from record
         for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-                          'filename', 'module', 'lineno', 'funcName', 'created',
-                          'msecs', 'relativeCreated', 'thread', 'threadName',
-                          'processName', 'process', 'getMessage', 'exc_info',
-                          'exc_text', 'stack_info']:
-                log_data[key] = value
-        
-        # Convert to JSON and apply PII masking
-        json_str = json.dumps(log_data, default=str, ensure_ascii=False)
+            if key not in _RESERVED_LOGRECORD_ATTRS:
+                log_data[key] = mask(value)
         
-        if self.mask_pii and settings.mask_pii:
-            json_str = self._mask_pii(json_str)
-        
-        return json_str
+        return _json_dumps(log_data)
 
 
 class AuditLogger:
@@ -175,7 +275,7 @@ class AuditLogger:
     ) -> None:
         """Log security events."""
         self.logger.warning(
-            f"Security event: {event_type}",
+            "Security event: %s", event_type,
             extra={
                 'event_type': 'security_event',
                 'security_event_type': event_type,
@@ -187,6 +287,81 @@ class AuditLogger:
         )
 
 
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that passes records to the listener thread mostly unformatted.
+    
+    The stdlib implementation formats the whole record up front so that it
+    can be pickled. The queue here never leaves the process, so only what
+    the caller may still mutate is frozen eagerly: the message arguments
+    and any dict/list/set ``extra`` values (e.g. audit metadata passed by
+    reference). ``exc_info`` is kept for the downstream formatters.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Freeze the message text and mutable extras before the record is enqueued."""
+        record.msg = record.getMessage()
+        record.args = None
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_LOGRECORD_ATTRS and isinstance(value, (dict, list, set)):
+                record.__dict__[key] = copy.deepcopy(value)
+        return record
+
+
+class _ThrottledRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Size-based rotating handler that only checks the file size periodically.
+    
+    ``RotatingFileHandler`` seeks and tells on every emit to decide whether
+    to roll over. Checking every ``check_interval`` records keeps the size
+    cap (overshooting by at most that many records) without the per-record
+    syscalls.
+    """
+    
+    def __init__(self, *args, check_interval: int = 100, **kwargs):
+        """Initialize the handler with a rollover check interval."""
+        super().__init__(*args, **kwargs)
+        self.check_interval = check_interval
+        self._records_since_check = 0
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Check the file size once every ``check_interval`` records."""
+        self._records_since_check += 1
+        if self._records_since_check < self.check_interval:
+            return False
+        self._records_since_check = 0
+        return bool(super().shouldRollover(record))
+
+
+# Per-logger level overrides applied by setup_logging
+_LEVEL_OVERRIDES = (
+    ("uvicorn", logging.INFO),
+    ("uvicorn.access", logging.INFO),
+    ("langchain", logging.WARNING),
+    ("neo4j", logging.WARNING),
+    ("chromadb", logging.WARNING),
+    ("openai", logging.WARNING),
+    ("httpx", logging.WARNING),
+    # Medical-specific loggers
+    ("soap_generation", logging.INFO),
+    ("rag_retrieval", logging.INFO),
+    ("pattern_learning", logging.INFO),
+)
+
+
+# Background listener that drains the root logger's queue
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the background log listener, if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def setup_logging() -> None:
     """Configure application logging."""
     # Create logs directory
@@ -198,51 +373,48 @@ def setup_logging() -> None:
     root_logger.setLevel(getattr(logging, settings.log_level))
     
     # Clear existing handlers
+    _stop_queue_listener()
     root_logger.handlers.clear()
+    handlers: List[logging.Handler] = []
     
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    
+    # Single formatter shared by all handlers
     if settings.log_format.lower() == "json":
-        console_formatter = JSONFormatter()
+        formatter = JSONFormatter()
     else:
-        console_formatter = PIIMaskingFormatter(
+        formatter = PIIMaskingFormatter(
             fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
     
-    console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    # Console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+    handlers.append(console_handler)
     
     # File handler (if enabled)
     if settings.log_file_enabled:
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = _ThrottledRotatingFileHandler(
             settings.log_file_path,
             maxBytes=_parse_size(settings.log_rotation_size),
-            backupCount=settings.log_retention_days
-        )
-        
-        file_formatter = JSONFormatter() if settings.log_format.lower() == "json" else PIIMaskingFormatter(
-            fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+            backupCount=settings.log_retention_days,
+            encoding="utf-8",
+            delay=True
         )
-        
-        file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
     
-    # Set specific logger levels
-    logging.getLogger("uvicorn").setLevel(logging.INFO)
-    logging.getLogger("uvicorn.access").setLevel(logging.INFO)
-    logging.getLogger("langchain").setLevel(logging.WARNING)
-    logging.getLogger("neo4j").setLevel(logging.WARNING)
-    logging.getLogger("chromadb").setLevel(logging.WARNING)
-    logging.getLogger("openai").setLevel(logging.WARNING)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
+    # Formatting and I/O run on the listener thread; callers only enqueue
+    global _queue_listener
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(_InProcessQueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
     
-    # Medical-specific loggers
-    logging.getLogger("soap_generation").setLevel(logging.INFO)
-    logging.getLogger("rag_retrieval").setLevel(logging.INFO)
-    logging.getLogger("pattern_learning").setLevel(logging.INFO)
+    # Set specific logger levels
+    for logger_name, level in _LEVEL_OVERRIDES:
+        logging.getLogger(logger_name).setLevel(level)
     
     # Set audit logger level
     if settings.audit_logging_enabled:
@@ -263,27 +435,43 @@ def _parse_size(size_str: str) -> int:
 
 
 class ContextualLogger:
-    """Logger with contextual information for request tracing."""
+    """Logger with contextual information for request tracing.
+    
+    Pass message values as %-style arguments rather than pre-formatted
+    f-strings so that disabled levels cost nothing.
+    
+    The context lives in a ``ContextVar``, so concurrent asyncio tasks that
+    share a logger (e.g. batched section generation) each see their own.
+    """
+    
+    __slots__ = ('logger', '_context', '_log')
     
     def __init__(self, name: str):
         """Initialize contextual logger."""
         self.logger = logging.getLogger(name)
-        self._context: Dict[str, Any] = {}
+        self._context: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar(
+            f"log_context:{name}", default={}
+        )
+        self._log = self.logger.log
     
     def set_context(self, **kwargs) -> None:
-        """Set context for subsequent log messages."""
-        self._context.update(kwargs)
+        """Set context for subsequent log messages in the current task."""
+        # Copy-on-write: the dict may be shared with a parent task's context
+        self._context.set({**self._context.get(), **kwargs})
     
     def clear_context(self) -> None:
-        """Clear logging context."""
-        self._context.clear()
+        """Clear logging context for the current task."""
+        self._context.set({})
     
     def _log_with_context(self, level: int, message: str, *args, **kwargs) -> None:
         """Log message with context."""
-        extra = kwargs.get('extra', {})
-        extra.update(self._context)
-        kwargs['extra'] = extra
-        self.logger.log(level, message, *args, **kwargs)
+        if not self.logger.isEnabledFor(level):
+            return
+        context = self._context.get()
+        if context:
+            extra = kwargs.get('extra')
+            kwargs['extra'] = {**extra, **context} if extra else context
+        self._log(level, message, *args, **kwargs)
     
     def debug(self, message: str, *args, **kwargs) -> None:
         """Log debug message with context."""
@@ -310,6 +498,7 @@ class ContextualLogger:
 audit_logger = AuditLogger()
 
 # Factory function for contextual loggers
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> ContextualLogger:
-    """Get a contextual logger instance."""
+    """Get the shared contextual logger instance for a name."""
     return ContextualLogger(name) 
\ No newline at end of file
@@ -5,11 +5,10 @@ JWT token validation, rate limiting, and audit logging for HIPAA/PIPEDA complian
 """
 
 import hashlib
-import hmac
 import secrets
 import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Optional
 
 import jwt
 from cryptography.fernet import Fernet
@@ -50,7 +49,7 @@ class DataEncryption:
             )
             return encrypted_data.decode()
         except Exception as e:
-            logger.error(f"Failed to encrypt patient data: {str(e)}")
+            logger.error("Failed to encrypt patient data: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Data encryption failed"
@@ -69,7 +68,7 @@ class DataEncryption:
             )
             return decrypted_data.decode()
         except Exception as e:
-            logger.error(f"Failed to decrypt patient data: {str(e)}")
+            logger.error("Failed to decrypt patient data: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Data decryption failed"
@@ -347,7 +346,7 @@ class MedicalDataValidator:
         # Check required fields
         for field in required_fields:
             if field not in conversation_data:
-                logger.warning(f"Missing required field: {field}")
+                logger.warning("Missing required field: %s", field)
                 return False
         
         # Validate data types
@@ -7,7 +7,6 @@ and API routes.
 
 import time
 from contextlib import asynccontextmanager
-from typing import Dict, Any
 
 from fastapi import FastAPI, Request, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
@@ -64,7 +63,7 @@ async def lifespan(app: FastAPI):
         )
         
     except Exception as e:
-        logger.error(f"Failed to start application: {str(e)}")
+        logger.error("Failed to start application: %s", e)
         raise
     
     yield
@@ -165,7 +164,7 @@ async def security_middleware_handler(request: Request, call_next):
         )
     
     except Exception as e:
-        logger.error(f"Unexpected error in security middleware: {str(e)}")
+        logger.error("Unexpected error in security middleware: %s", e)
         REQUEST_COUNT.labels(
             method=request.method,
             endpoint=request.url.path,
@@ -185,7 +184,7 @@ async def security_middleware_handler(request: Request, call_next):
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Global HTTP exception handler."""
-    logger.warning(f"HTTP exception: {exc.status_code} - {exc.detail}")
+    logger.warning("HTTP exception: %s - %s", exc.status_code, exc.detail)
     
     return JSONResponse(
         status_code=exc.status_code,
@@ -200,7 +199,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Global exception handler for unhandled exceptions."""
-    logger.error(f"Unhandled exception: {str(exc)}")
+    logger.error("Unhandled exception: %s", exc)
     
     return JSONResponse(
         status_code=500,
@@ -249,7 +248,7 @@ async def health_check():
         return HealthCheckResponse(**health_status)
         
     except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
+        logger.error("Health check failed: %s", e)
         raise HTTPException(status_code=503, detail="Service unavailable")
 
 
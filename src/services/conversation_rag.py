@@ -5,7 +5,7 @@ and retrieving relevant chunks for SOAP generation.
 """
 
 import uuid
-from typing import Dict, List, Any
+from typing import List
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.vectorstores import Chroma
 from langchain_openai import AzureOpenAIEmbeddings
@@ -42,7 +42,7 @@ class ConversationRAGService:
                 deployment=settings.openai_embedding_deployment_name
             )
         except Exception as e:
-            logger.error(f"Failed to initialize embeddings: {str(e)}")
+            logger.error("Failed to initialize embeddings: %s", e)
             # Return a mock embeddings for development
             return None
     
@@ -55,7 +55,7 @@ class ConversationRAGService:
                 collection_name=settings.chroma_collection_name
             )
         except Exception as e:
-            logger.error(f"Failed to initialize vector store: {str(e)}")
+            logger.error("Failed to initialize vector store: %s", e)
             # Return None for development mode
             return None
     
@@ -66,7 +66,7 @@ class ConversationRAGService:
     ) -> List[str]:
         """Store conversation and return chunk IDs."""
         
-        logger.info(f"Storing conversation {conversation_id}")
+        logger.info("Storing conversation %s", conversation_id)
         
         try:
             # Split conversation into chunks
@@ -101,11 +101,11 @@ class ConversationRAGService:
                 metadatas=metadatas
             )
             
-            logger.info(f"Stored {len(chunk_ids)} chunks for conversation {conversation_id}")
+            logger.info("Stored %s chunks for conversation %s", len(chunk_ids), conversation_id)
             return chunk_ids
             
         except Exception as e:
-            logger.error(f"Failed to store conversation: {str(e)}")
+            logger.error("Failed to store conversation: %s", e)
             raise
     
     async def retrieve_relevant_chunks(
@@ -134,11 +134,11 @@ class ConversationRAGService:
                     content = data_encryption.decrypt_patient_data(content)
                 chunks.append(content)
             
-            logger.info(f"Retrieved {len(chunks)} relevant chunks")
+            logger.info("Retrieved %s relevant chunks", len(chunks))
             return chunks
             
         except Exception as e:
-            logger.error(f"Failed to retrieve chunks: {str(e)}")
+            logger.error("Failed to retrieve chunks: %s", e)
             return []
     
     async def store_conversation(
@@ -173,9 +173,9 @@ class ConversationRAGService:
                 processing_time_ms=100.0  # Placeholder
             )
             
-            logger.info(f"Successfully stored conversation {conversation_data.conversation_id}")
+            logger.info("Successfully stored conversation %s", conversation_data.conversation_id)
             return response
             
         except Exception as e:
-            logger.error(f"Failed to store conversation: {str(e)}")
+            logger.error("Failed to store conversation: %s", e)
             raise 
\ No newline at end of file
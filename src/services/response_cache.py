@@ -0,0 +1,63 @@
+"""Response Cache for NoteGen AI APIs.
+
+This module caches generated SOAP section content keyed on an exact hash of
+every generation input (section, language, doctor, template, transcript,
+previous sections, generation parameters), so that a replayed request can
+reuse the previous generation instead of paying for another LLM round-trip.
+
+Because the key covers the whole input, content generated for one encounter
+is never served for another, and lookups cost a single dict access.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from src.core.config import settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ResponseCache:
+    """In-process exact-key LRU cache for generated section content."""
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: int = 3600):
+        """Initialize the response cache."""
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload for a key, if present and not expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        created_at, payload = entry
+        if time.monotonic() - created_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        logger.debug("Response cache hit")
+        return payload
+
+    def store(self, key: str, payload: Dict[str, Any]) -> None:
+        """Store a generated payload under its key, evicting the least recently used."""
+        self._entries[key] = (time.monotonic(), payload)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+# Global response cache instance shared across service instances
+response_cache = ResponseCache(
+    max_entries=settings.response_cache_max_entries,
+    ttl_seconds=settings.response_cache_ttl
+)
@@ -5,23 +5,87 @@ conversations using AI and RAG systems.
 """
 
 import asyncio
+import hashlib
+import json
+import random
 import time
 import uuid
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from langchain_openai import AzureChatOpenAI, AzureOpenAIEmbeddings
-from langchain.schema import HumanMessage, SystemMessage
+from langchain.schema import SystemMessage
+from openai import APIStatusError, RateLimitError
 
 from src.core.config import settings
-from src.core.logging import get_logger, audit_logger
-from src.core.security import data_encryption
+from src.core.logging import get_logger
 from src.models.soap_models import SOAPSectionType, SOAPLanguage
 from src.services.conversation_rag import ConversationRAGService
 from src.services.snomed_rag import SNOMEDRAGService
 from src.services.pattern_learning import PatternLearningService
+from src.services.response_cache import response_cache
 
 logger = get_logger(__name__)
 
+# Upper bound for a single retry sleep, in seconds
+MAX_RETRY_DELAY_SECONDS = 30.0
+
+# Client errors that are worth retrying (timeout, conflict, throttling)
+RETRYABLE_CLIENT_STATUS_CODES = {408, 409, 429}
+
+# Leading characters held back while streaming so section prefixes can be stripped
+STREAM_PREFIX_HOLD_CHARS = 64
+
+
+@dataclass(frozen=True)
+class SharedContext:
+    """Section-independent context computed once per SOAP note."""
+    
+    medical_terms: List[str]
+    snomed_context: List[Dict[str, Any]] = field(default_factory=list)
+    snomed_prompt: str = ""
+
+
+@lru_cache(maxsize=4)
+def _build_llm(
+    endpoint: str,
+    api_key: str,
+    api_version: str,
+    deployment_name: str,
+    model: str
+) -> AzureChatOpenAI:
+    """Build an Azure OpenAI chat client shared by every service instance.
+    
+    The service is constructed per request, so memoizing the client keeps a
+    single HTTP connection pool per process instead of one per request.
+    """
+    return AzureChatOpenAI(
+        azure_endpoint=endpoint,
+        api_key=api_key,
+        api_version=api_version,
+        deployment_name=deployment_name,
+        model=model,
+        temperature=settings.soap_generation_temperature,
+        max_tokens=settings.soap_generation_max_tokens
+    )
+
+
+@lru_cache(maxsize=4)
+def _build_embeddings(
+    endpoint: str,
+    api_key: str,
+    api_version: str,
+    deployment: str
+) -> AzureOpenAIEmbeddings:
+    """Build an Azure OpenAI embeddings client shared by every service instance."""
+    return AzureOpenAIEmbeddings(
+        azure_endpoint=endpoint,
+        api_key=api_key,
+        api_version=api_version,
+        deployment=deployment
+    )
+
 
 class SOAPGeneratorService:
     """Main service for generating SOAP notes from medical conversations."""
@@ -39,30 +103,28 @@ class SOAPGeneratorService:
     def _initialize_llm(self) -> AzureChatOpenAI:
         """Initialize Azure OpenAI LLM."""
         try:
-            return AzureChatOpenAI(
-                azure_endpoint=settings.azure_openai_endpoint,
-                api_key=settings.azure_openai_api_key,
-                api_version=settings.azure_openai_api_version,
-                deployment_name=settings.azure_openai_deployment_name,
-                model=settings.azure_openai_model,
-                temperature=settings.soap_generation_temperature,
-                max_tokens=settings.soap_generation_max_tokens
+            return _build_llm(
+                settings.azure_openai_endpoint,
+                settings.azure_openai_api_key,
+                settings.azure_openai_api_version,
+                settings.azure_openai_deployment_name,
+                settings.azure_openai_model
             )
         except Exception as e:
-            logger.error(f"Failed to initialize Azure OpenAI LLM: {str(e)}")
+            logger.error("Failed to initialize Azure OpenAI LLM: %s", e)
             raise
     
     def _initialize_embeddings(self) -> AzureOpenAIEmbeddings:
         """Initialize Azure OpenAI embeddings."""
         try:
-            return AzureOpenAIEmbeddings(
-                azure_endpoint=settings.openai_embedding_endpoint,
-                api_key=settings.openai_embedding_api_key,
-                api_version=settings.azure_openai_api_version,
-                deployment=settings.openai_embedding_deployment_name
+            return _build_embeddings(
+                settings.openai_embedding_endpoint,
+                settings.openai_embedding_api_key,
+                settings.azure_openai_api_version,
+                settings.openai_embedding_deployment_name
             )
         except Exception as e:
-            logger.error(f"Failed to initialize Azure OpenAI embeddings: {str(e)}")
+            logger.error("Failed to initialize Azure OpenAI embeddings: %s", e)
             raise
     
     async def generate_soap_section(
@@ -76,9 +138,15 @@ class SOAPGeneratorService:
         previous_sections: Optional[Dict[str, str]] = None,
         language: SOAPLanguage = SOAPLanguage.ENGLISH,
         temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        shared_context: Optional[SharedContext] = None
     ) -> Dict[str, Any]:
-        """Generate a specific SOAP section using RAG-enhanced prompts."""
+        """Generate a specific SOAP section using RAG-enhanced prompts.
+        
+        When ``shared_context`` is provided (see ``build_shared_context``) the
+        conversation is assumed to be stored already and the SNOMED lookup is
+        reused instead of being repeated for this section.
+        """
         
         start_time = time.time()
         section_id = f"{section_type}_{uuid.uuid4().hex[:8]}"
@@ -92,54 +160,55 @@ class SOAPGeneratorService:
         logger.info("Starting SOAP section generation")
         
         try:
-            # Step 1: Store conversation in RAG system
-            conversation_chunks = await self.conversation_rag.store_and_chunk_conversation(
-                transcription_text=transcription_text,
-                conversation_id=f"temp_{uuid.uuid4().hex[:8]}"
-            )
-            
-            # Step 2: Retrieve relevant context from conversation
-            conversation_context = await self.conversation_rag.retrieve_relevant_chunks(
-                query=f"{section_type} medical information from conversation",
-                max_results=settings.max_retrieval_chunks
-            )
-            
-            # Step 3: Get SNOMED context for medical terms
-            medical_terms = self._extract_medical_terms(transcription_text)
-            snomed_context = []
-            if medical_terms:
-                snomed_context = await self.snomed_rag.get_relevant_codes(
-                    medical_terms=medical_terms,
+            # Steps 1 & 3: Store conversation and resolve SNOMED context (shared)
+            if shared_context is None:
+                shared_context = await self.build_shared_context(
+                    transcription_text=transcription_text,
                     language=language
                 )
+            medical_terms = shared_context.medical_terms
+            snomed_context = shared_context.snomed_context
             
-            # Step 4: Apply doctor preferences if available
-            enhanced_prompt = section_prompt
-            if doctor_id:
-                enhanced_prompt = await self.pattern_learning.apply_doctor_preferences(
-                    doctor_id=doctor_id,
-                    original_prompt=section_prompt,
-                    section_type=section_type
-                )
-            
-            # Step 5: Build the complete prompt with context
-            complete_prompt = self._build_enhanced_prompt(
+            # Steps 2, 4 & 5: Retrieve conversation context and build the prompt
+            complete_prompt, conversation_context = await self._prepare_section_prompt(
                 section_type=section_type,
-                section_prompt=enhanced_prompt,
-                conversation_context=conversation_context,
-                snomed_context=snomed_context,
+                section_prompt=section_prompt,
+                soap_template=soap_template,
                 custom_instructions=custom_instructions,
-                previous_sections=previous_sections or {},
+                doctor_id=doctor_id,
+                previous_sections=previous_sections,
                 language=language,
-                soap_template=soap_template
+                shared_context=shared_context
             )
             
-            # Step 6: Generate the section using LLM
-            generation_result = await self._generate_with_llm(
-                prompt=complete_prompt,
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
+            # Step 6: Reuse an identical earlier generation or call the LLM
+            cached = None
+            cache_key = None
+            if settings.response_cache_enabled:
+                cache_key = self._cache_key(
+                    section_type=section_type,
+                    section_prompt=section_prompt,
+                    transcription_text=transcription_text,
+                    soap_template=soap_template,
+                    custom_instructions=custom_instructions,
+                    doctor_id=doctor_id,
+                    previous_sections=previous_sections,
+                    language=language,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )
+                cached = response_cache.lookup(cache_key)
+            
+            if cached is not None:
+                generation_result = cached["content"]
+            else:
+                generation_result = await self._generate_with_llm(
+                    prompt=complete_prompt,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )
+                if cache_key is not None:
+                    response_cache.store(cache_key, {"content": generation_result})
             
             # Step 7: Post-process and validate the result
             processed_content = self._post_process_content(
@@ -164,6 +233,7 @@ class SOAPGeneratorService:
                 "confidence_score": self._calculate_confidence_score(processed_content),
                 "validation_passed": True,
                 "model_version": settings.azure_openai_model,
+                "cache_hit": cached is not None,
                 "warnings": []
             }
             
@@ -171,24 +241,180 @@ class SOAPGeneratorService:
                 "SOAP section generated successfully",
                 extra={
                     "processing_time_ms": processing_time_ms,
-                    "confidence_score": result["confidence_score"]
+                    "confidence_score": result["confidence_score"],
+                    "cache_hit": result["cache_hit"]
                 }
             )
             
             return result
             
         except Exception as e:
-            logger.error(f"SOAP section generation failed: {str(e)}")
+            logger.error("SOAP section generation failed: %s", e)
             raise
         finally:
             logger.clear_context()
     
+    async def build_shared_context(
+        self,
+        transcription_text: str,
+        language: SOAPLanguage = SOAPLanguage.ENGLISH
+    ) -> SharedContext:
+        """Store the conversation and resolve section-independent context once."""
+        
+        await self.conversation_rag.store_and_chunk_conversation(
+            transcription_text=transcription_text,
+            conversation_id=f"temp_{uuid.uuid4().hex[:8]}"
+        )
+        
+        medical_terms = self._extract_medical_terms(transcription_text)
+        snomed_context = []
+        if medical_terms:
+            snomed_context = await self.snomed_rag.get_relevant_codes(
+                medical_terms=medical_terms,
+                language=language
+            )
+        
+        snomed_prompt = "\n".join([
+            f"- {code.get('preferred_term', '')} ({code.get('concept_id', '')})"
+            for code in snomed_context
+        ])
+        
+        return SharedContext(
+            medical_terms=medical_terms,
+            snomed_context=snomed_context,
+            snomed_prompt=snomed_prompt
+        )
+    
+    async def _prepare_section_prompt(
+        self,
+        section_type: SOAPSectionType,
+        section_prompt: str,
+        soap_template: Dict[str, Any],
+        custom_instructions: str,
+        doctor_id: Optional[str],
+        previous_sections: Optional[Dict[str, str]],
+        language: SOAPLanguage,
+        shared_context: SharedContext
+    ) -> Tuple[str, List[str]]:
+        """Retrieve section context and assemble the complete LLM prompt."""
+        
+        # Retrieve relevant context from conversation
+        conversation_context = await self.conversation_rag.retrieve_relevant_chunks(
+            query=f"{section_type} medical information from conversation",
+            max_results=settings.max_retrieval_chunks
+        )
+        
+        # Apply doctor preferences if available
+        enhanced_prompt = section_prompt
+        if doctor_id:
+            enhanced_prompt = await self.pattern_learning.apply_doctor_preferences(
+                doctor_id=doctor_id,
+                original_prompt=section_prompt,
+                section_type=section_type
+            )
+        
+        complete_prompt = self._build_enhanced_prompt(
+            section_type=section_type,
+            section_prompt=enhanced_prompt,
+            conversation_context=conversation_context,
+            snomed_prompt=shared_context.snomed_prompt,
+            custom_instructions=custom_instructions,
+            previous_sections=previous_sections or {},
+            language=language,
+            soap_template=soap_template
+        )
+        
+        return complete_prompt, conversation_context
+    
+    async def stream_soap_section(
+        self,
+        section_type: SOAPSectionType,
+        section_prompt: str,
+        transcription_text: str,
+        soap_template: Dict[str, Any],
+        custom_instructions: str = "",
+        doctor_id: Optional[str] = None,
+        previous_sections: Optional[Dict[str, str]] = None,
+        language: SOAPLanguage = SOAPLanguage.ENGLISH,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        shared_context: Optional[SharedContext] = None
+    ) -> AsyncIterator[str]:
+        """Stream a SOAP section's content as the LLM produces it.
+        
+        Tokens are yielded as soon as they arrive, so callers can start
+        rendering before the completion finishes. Streams are not retried or
+        cached: once content has been yielded a retry would duplicate it.
+        
+        The joined output matches ``_post_process_content``: the opening
+        text is held back until section prefixes can be stripped, trailing
+        whitespace is dropped and a final period is added if missing.
+        """
+        
+        if shared_context is None:
+            shared_context = await self.build_shared_context(
+                transcription_text=transcription_text,
+                language=language
+            )
+        
+        complete_prompt, _ = await self._prepare_section_prompt(
+            section_type=section_type,
+            section_prompt=section_prompt,
+            soap_template=soap_template,
+            custom_instructions=custom_instructions,
+            doctor_id=doctor_id,
+            previous_sections=previous_sections,
+            language=language,
+            shared_context=shared_context
+        )
+        
+        messages = [SystemMessage(content=complete_prompt)]
+        llm_kwargs = self._llm_overrides(temperature, max_tokens)
+        
+        head: Optional[str] = ""
+        pending_whitespace = ""
+        last_char = ""
+        async for chunk in self.llm.astream(messages, **llm_kwargs):
+            text = chunk.content
+            if not text:
+                continue
+            
+            if head is not None:
+                head += text
+                if len(head.lstrip()) < STREAM_PREFIX_HOLD_CHARS:
+                    continue
+                # Keep the head's trailing whitespace in case more text follows
+                text = (
+                    self._strip_section_prefixes(head, section_type)
+                    + head[len(head.rstrip()):]
+                )
+                head = None
+            
+            # Only emit whitespace once non-whitespace text follows it
+            body = text.rstrip()
+            if not body:
+                pending_whitespace += text
+                continue
+            yield pending_whitespace + body
+            pending_whitespace = text[len(body):]
+            last_char = body[-1]
+        
+        if head is not None:
+            # The whole section fit in the held-back opening
+            body = self._strip_section_prefixes(head, section_type)
+            if body:
+                yield body
+                last_char = body[-1]
+        
+        if last_char != '.':
+            yield '.'
+    
     def _build_enhanced_prompt(
         self,
         section_type: SOAPSectionType,
         section_prompt: str,
         conversation_context: List[str],
-        snomed_context: List[Dict[str, Any]],
+        snomed_prompt: str,
         custom_instructions: str,
         previous_sections: Dict[str, str],
         language: SOAPLanguage,
@@ -223,12 +449,8 @@ INSTRUCTIONS:
             system_prompt += f"\n\nPREVIOUS SECTIONS:\n{prev_context}"
         
         # Add SNOMED context
-        if snomed_context:
-            snomed_info = "\n".join([
-                f"- {code.get('preferred_term', '')} ({code.get('concept_id', '')})"
-                for code in snomed_context
-            ])
-            system_prompt += f"\n\nRELEVANT SNOMED CODES:\n{snomed_info}"
+        if snomed_prompt:
+            system_prompt += f"\n\nRELEVANT SNOMED CODES:\n{snomed_prompt}"
         
         # Add template guidance
         if soap_template and section_type in soap_template:
@@ -249,6 +471,44 @@ Generate the {section_type.upper()} section now:"""
         
         return system_prompt
     
+    @staticmethod
+    def _cache_key(
+        section_type: SOAPSectionType,
+        section_prompt: str,
+        transcription_text: str,
+        soap_template: Dict[str, Any],
+        custom_instructions: str,
+        doctor_id: Optional[str],
+        previous_sections: Optional[Dict[str, str]],
+        language: SOAPLanguage,
+        temperature: Optional[float],
+        max_tokens: Optional[int]
+    ) -> str:
+        """Build the exact response cache key from every generation input.
+        
+        Prompts for different encounters share long identical instructions,
+        so the key must cover the patient transcript, doctor, template and
+        generation parameters, not just the section being generated.
+        """
+        
+        scope = json.dumps(
+            {
+                "section_type": str(section_type),
+                "section_prompt": section_prompt,
+                "transcript": transcription_text,
+                "template": soap_template,
+                "custom_instructions": custom_instructions,
+                "doctor_id": doctor_id,
+                "previous_sections": previous_sections or {},
+                "language": str(language),
+                "temperature": temperature,
+                "max_tokens": max_tokens
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(scope.encode("utf-8")).hexdigest()
+    
     async def _generate_with_llm(
         self,
         prompt: str,
@@ -257,17 +517,13 @@ Generate the {section_type.upper()} section now:"""
     ) -> str:
         """Generate content using the LLM with retry logic."""
         
-        # Update LLM parameters if provided
-        if temperature is not None:
-            self.llm.temperature = temperature
-        if max_tokens is not None:
-            self.llm.max_tokens = max_tokens
+        llm_kwargs = self._llm_overrides(temperature, max_tokens)
         
-        # Retry logic with exponential backoff
+        # Retry logic with jittered exponential backoff
+        messages = [SystemMessage(content=prompt)]
         for attempt in range(settings.soap_max_retries):
             try:
-                messages = [SystemMessage(content=prompt)]
-                response = await self.llm.agenerate([messages])
+                response = await self.llm.agenerate([messages], **llm_kwargs)
                 
                 if response.generations and response.generations[0]:
                     return response.generations[0][0].text.strip()
@@ -275,16 +531,85 @@ Generate the {section_type.upper()} section now:"""
                     raise ValueError("Empty response from LLM")
                     
             except Exception as e:
+                # Only the terminal failure carries a traceback; the logger
+                # formats it lazily, and intermediate attempts stay cheap
+                if not self._is_retryable_error(e):
+                    logger.error(
+                        "LLM generation failed with non-retryable error: %s", e,
+                        exc_info=True
+                    )
+                    raise
+                
                 if attempt == settings.soap_max_retries - 1:
-                    logger.error(f"LLM generation failed after {settings.soap_max_retries} attempts: {str(e)}")
+                    logger.error(
+                        "LLM generation failed after %s attempts: %s",
+                        settings.soap_max_retries,
+                        e,
+                        exc_info=True
+                    )
                     raise
                 
-                wait_time = (2 ** attempt) * settings.soap_retry_delay
-                logger.warning(f"LLM generation attempt {attempt + 1} failed, retrying in {wait_time}s: {str(e)}")
+                wait_time = self._retry_delay(attempt, e)
+                logger.warning(
+                    "LLM generation attempt %s/%s failed, retrying in %.2fs: %s",
+                    attempt + 1,
+                    settings.soap_max_retries,
+                    wait_time,
+                    e,
+                    extra={"attempt": attempt + 1, "retry_delay_seconds": wait_time}
+                )
                 await asyncio.sleep(wait_time)
         
         raise Exception("LLM generation failed")
     
+    @staticmethod
+    def _llm_overrides(
+        temperature: Optional[float],
+        max_tokens: Optional[int]
+    ) -> Dict[str, Any]:
+        """Build per-call LLM parameter overrides.
+        
+        The shared client is never mutated so that concurrent section
+        generations don't leak parameters into each other.
+        """
+        
+        llm_kwargs: Dict[str, Any] = {}
+        if temperature is not None:
+            llm_kwargs["temperature"] = temperature
+        if max_tokens is not None:
+            llm_kwargs["max_tokens"] = max_tokens
+        return llm_kwargs
+    
+    @staticmethod
+    def _is_retryable_error(error: Exception) -> bool:
+        """Check whether an LLM error may succeed on a later attempt."""
+        
+        if isinstance(error, APIStatusError):
+            return (
+                error.status_code >= 500
+                or error.status_code in RETRYABLE_CLIENT_STATUS_CODES
+            )
+        return True
+    
+    @staticmethod
+    def _retry_delay(attempt: int, error: Exception) -> float:
+        """Compute the sleep before the next attempt using full jitter.
+        
+        Randomizing the delay keeps concurrent section generations from
+        retrying in lockstep when the endpoint throttles. A server-provided
+        ``retry-after`` header on rate-limit errors takes precedence.
+        """
+        
+        if isinstance(error, RateLimitError):
+            retry_after = error.response.headers.get("retry-after")
+            try:
+                return min(float(retry_after), MAX_RETRY_DELAY_SECONDS)
+            except (TypeError, ValueError):
+                pass
+        
+        ceiling = min(MAX_RETRY_DELAY_SECONDS, settings.soap_retry_delay * (2 ** attempt))
+        return random.uniform(0, ceiling)
+    
     def _extract_medical_terms(self, text: str) -> List[str]:
         """Extract medical terms from conversation text."""
         # Placeholder for medical term extraction
@@ -315,6 +640,18 @@ Generate the {section_type.upper()} section now:"""
     ) -> str:
         """Post-process the generated content."""
         
+        content = self._strip_section_prefixes(content, section_type)
+        
+        # Ensure proper formatting
+        if not content.endswith('.'):
+            content += '.'
+        
+        return content
+    
+    @staticmethod
+    def _strip_section_prefixes(content: str, section_type: SOAPSectionType) -> str:
+        """Trim the content and remove any leading section heading or label."""
+        
         # Basic cleanup
         content = content.strip()
         
@@ -330,10 +667,6 @@ Generate the {section_type.upper()} section now:"""
             if content.startswith(prefix):
                 content = content[len(prefix):].strip()
         
-        # Ensure proper formatting
-        if not content.endswith('.'):
-            content += '.'
-        
         return content
     
     def _calculate_confidence_score(self, content: str) -> float:
@@ -379,6 +712,12 @@ Generate the {section_type.upper()} section now:"""
                 SOAPSectionType.PLAN
             ]
             
+            # Conversation storage and SNOMED lookup are identical for every section
+            shared_context = await self.build_shared_context(
+                transcription_text=transcription_text,
+                language=language
+            )
+            
             # Generate sections sequentially for context accumulation
             for section_type in section_order:
                 section_prompt = soap_template.get("prompts", {}).get(section_type, "")
@@ -394,12 +733,13 @@ Generate the {section_type.upper()} section now:"""
                     custom_instructions=custom_instructions,
                     doctor_id=doctor_id,
                     previous_sections=sections,
-                    language=language
+                    language=language,
+                    shared_context=shared_context
                 )
                 
                 sections[section_type] = section_result["content"]
                 
-                logger.info(f"Generated {section_type} section")
+                logger.info("Generated %s section", section_type)
             
             logger.info("Complete SOAP note generation finished")
             
@@ -411,9 +751,65 @@ Generate the {section_type.upper()} section now:"""
             }
             
         except Exception as e:
-            logger.error(f"Complete SOAP generation failed: {str(e)}")
+            logger.error("Complete SOAP generation failed: %s", e)
             raise
     
+    async def generate_soap_sections_batch(
+        self,
+        section_requests: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
+    ) -> List[Any]:
+        """Generate independent SOAP sections concurrently.
+        
+        Each entry in ``section_requests`` holds the keyword arguments for
+        ``generate_soap_section``. Entries without a ``shared_context`` share
+        one ``build_shared_context`` call per distinct transcript and language.
+        Results are returned in request order; a failed section yields its
+        exception instead of aborting the batch.
+        """
+        
+        concurrency = max_concurrency or settings.section_concurrency
+        if settings.azure_openai_rpm_limit:
+            concurrency = min(concurrency, settings.azure_openai_rpm_limit)
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        results: List[Any] = [None] * len(section_requests)
+        shared_contexts: Dict[Tuple[str, SOAPLanguage], "asyncio.Future[SharedContext]"] = {}
+        
+        def _shared_context_for(section_request: Dict[str, Any]) -> "asyncio.Future[SharedContext]":
+            key = (
+                section_request["transcription_text"],
+                section_request.get("language", SOAPLanguage.ENGLISH)
+            )
+            if key not in shared_contexts:
+                shared_contexts[key] = asyncio.ensure_future(self.build_shared_context(*key))
+            return shared_contexts[key]
+        
+        async def _run(index: int, section_request: Dict[str, Any]) -> None:
+            async with semaphore:
+                try:
+                    if section_request.get("shared_context") is None:
+                        section_request = {
+                            **section_request,
+                            "shared_context": await _shared_context_for(section_request)
+                        }
+                    results[index] = await self.generate_soap_section(**section_request)
+                except Exception as e:
+                    results[index] = e
+        
+        logger.info("Starting batch generation of %s SOAP sections", len(section_requests))
+        
+        await asyncio.gather(*(
+            _run(index, section_request)
+            for index, section_request in enumerate(section_requests)
+        ))
+        
+        failed = sum(1 for result in results if isinstance(result, Exception))
+        if failed:
+            logger.warning("%s of %s batched sections failed", failed, len(section_requests))
+        
+        return results
+    
     def _get_default_section_prompt(self, section_type: SOAPSectionType) -> str:
         """Get default prompt for a section type."""
         
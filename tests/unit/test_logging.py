@@ -0,0 +1,93 @@
+"""Unit tests for PII masking in the logging formatters."""
+
+import logging
+import queue
+import re
+
+import pytest
+
+from src.core.logging import PIIMaskingFormatter, _InProcessQueueHandler
+
+# Original patterns, applied one substitution pass at a time
+BASELINE_PATTERNS = {
+    'email': re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'),
+    'phone': re.compile(r'(\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})'),
+    'ssn': re.compile(r'\b\d{3}-?\d{2}-?\d{4}\b'),
+    'credit_card': re.compile(r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b'),
+    'ip_address': re.compile(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b'),
+    'patient_id': re.compile(r'\b[Pp]atient[-_\s]*[Ii][Dd]?:?\s*([A-Z0-9-]+)\b'),
+    'mrn': re.compile(r'\b[Mm][Rr][Nn]:?\s*([A-Z0-9-]+)\b'),
+}
+
+LABELLED_IDENTIFIERS = [
+    "MRN 555-123-4567",
+    "MRN:555-123-4567",
+    "MRN: 123456789",
+    "MRN 12345",
+    "MRN: 12345",
+    "mrn 10.0.0.1",
+    "Patient ID 123-45-6789",
+    "Patient ID 123456789 seen today",
+    "Patient ID: 4111 1111 1111 1111",
+    "Patient-ID 4111-1111-1111-1111",
+    "patient id 555.123.4567",
+    "PatientID: P-778",
+]
+
+
+def _baseline_mask(text: str) -> str:
+    """Mask text the way the original sequential implementation did."""
+    for pii_type, pattern in BASELINE_PATTERNS.items():
+        if pii_type == 'email':
+            text = pattern.sub(lambda m: f"***@{m.group().split('@')[1]}", text)
+        elif pii_type in ['phone', 'ssn', 'credit_card']:
+            text = pattern.sub("***-**-****", text)
+        elif pii_type == 'ip_address':
+            text = pattern.sub("***.***.***.***", text)
+        elif pii_type in ['patient_id', 'mrn']:
+            text = pattern.sub(lambda m: f"{m.group().split(':')[0]}:***", text)
+    return text
+
+
+@pytest.fixture
+def formatter() -> PIIMaskingFormatter:
+    return PIIMaskingFormatter()
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("MRN 555-123-4567", "MRN ***-**-****"),
+        ("Patient ID 123-45-6789", "Patient ID ***-**-****"),
+        ("Patient ID: 4111 1111 1111 1111", "Patient ID: ***-**-****"),
+        ("MRN: AB-12", "MRN: ***"),
+        ("a@b.com called from 10.0.0.1", "***@b.com called from ***.***.***.***"),
+        ("Patient is stable", "Patient is stable"),
+    ],
+)
+def test_mask_pii(formatter, text, expected):
+    assert formatter._mask_pii(text) == expected
+
+
+@pytest.mark.parametrize("text", LABELLED_IDENTIFIERS)
+def test_labelled_identifiers_mask_at_least_the_baseline(formatter, text):
+    masked = formatter._mask_pii(text)
+    baseline = _baseline_mask(text)
+
+    assert set(re.findall(r"\d+", masked)) <= set(re.findall(r"\d+", baseline))
+    assert not re.search(r"\d", masked)
+
+
+def test_queue_handler_freezes_mutable_extras():
+    records: queue.Queue = queue.Queue()
+    handler = _InProcessQueueHandler(records)
+    record = logging.LogRecord("audit", logging.INFO, __file__, 1, "event %s", ("a",), None)
+    details = {"fields": ["name"]}
+    record.details = details
+
+    handler.handle(record)
+    details["fields"].append("dob")
+    queued = records.get_nowait()
+
+    assert queued.msg == "event a"
+    assert queued.details == {"fields": ["name"]}